@@ -19,6 +19,7 @@
 '''
 #pylint: skip-file
 
+import os
 import shutil
 import subprocess
 
@@ -70,12 +71,15 @@ class Repo(dbus.service.Object):
             sender, conn, 'org.pop_os.repolib.modifysources'
         )
         print(cmd)
-        key_path = str(cmd.pop(-1))
-        with open(key_path, mode='wb') as keyfile:
-            try:
+        key_path = Path(cmd.pop(-1))
+        tmp_path = key_path.with_suffix(key_path.suffix + '.tmp')
+        try:
+            with open(tmp_path, mode='wb') as keyfile:
                 subprocess.run(cmd, check=True, stdout=keyfile)
-            except subprocess.CalledProcessError as e:
-                raise e
+            os.replace(tmp_path, key_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     @dbus.service.method(
         "org.pop_os.repolib.Interface",
@@ -86,7 +90,14 @@ class Repo(dbus.service.Object):
         self._check_polkit_privilege(
             sender, conn, 'org.pop_os.repolib.modifysources'
         )
-        shutil.copy2(src, dest)
+        dest_path = Path(dest)
+        tmp_path = dest_path.with_suffix(dest_path.suffix + '.tmp')
+        try:
+            shutil.copy2(src, tmp_path)
+            os.replace(tmp_path, dest_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     @dbus.service.method(
         "org.pop_os.repolib.Interface",
@@ -25,6 +25,10 @@ from argparse import SUPPRESS
 from .command import Command, RepolibCommandError
 from .. import util, system
 
+# Returned by an action which was requested, but is already in effect. The
+# command succeeds without rewriting the source file.
+ALREADY_SET = 'already set'
+
 class Modify(Command):
     """Modify Subcommand
     
@@ -247,6 +251,9 @@ class Modify(Command):
         if True in rets:
             self.source.file.save()
             return True
+        elif ALREADY_SET in rets:
+            self.log.info('No changes needed for %s', self.repo)
+            return True
         else:
             self.log.warning('No valid changes specified, no actions taken.')
             return False
@@ -257,7 +264,7 @@ class Modify(Command):
             return False
         
         if self.system_source:
-            self.source['X-Repolib-Default-Mirror'] = value
+            self.source.default_mirror = value
             return True
         return False
 
@@ -270,30 +277,44 @@ class Modify(Command):
         self.source.name = value
         return True
     
-    def endisable(self, value:str) -> bool:
-        """Enable or disable the source"""
+    def endisable(self, value:str):
+        """Enable or disable the source
+
+        Returns: `True` if the source was changed, ALREADY_SET if it was
+            already in the requested state, otherwise `False`.
+        """
         if not value:
             return False
         
-        self.log.info('%sing source %s', value[:-1], self.repo)
-        if value == 'disable':
-            self.source.enabled = False
-            return True
+        enabled:bool = value == 'enable'
+        if self.source.get('Enabled') == ('yes' if enabled else 'no'):
+            self.log.info('Source %s is already %sd', self.repo, value)
+            return ALREADY_SET
 
-        self.source.enabled = True
+        self.log.info('%sing source %s', value[:-1], self.repo)
+        self.source.enabled = enabled
         return True
     
-    def source_endisable(self, value:str) -> bool:
-        """Enable/disable source code for the repo"""
+    def source_endisable(self, value:str):
+        """Enable/disable source code for the repo
+
+        Returns: `True` if the source was changed, ALREADY_SET if it was
+            already in the requested state, otherwise `False`.
+        """
         if not value:
             return False
         
+        types:list = [util.SourceType.BINARY]
+        if value == 'source_enable':
+            types.append(util.SourceType.SOURCECODE)
+        if self.source.types == types:
+            self.log.info(
+                'Source code for source %s is already %sd', self.repo, value[7:]
+            )
+            return ALREADY_SET
+
         self.log.info('%sing source code for source %s', value[7:-1], self.repo)
-        if value == 'source_disable':
-            self.source.sourcecode_enabled = False
-            return True
-        
-        self.source.sourcecode_enabled = True
+        self.source.types = types
         return True
     
     def add_uri(self, values:str) -> bool:
@@ -303,6 +324,7 @@ class Modify(Command):
 
         self.log.info('Adding URIs: %s', values)
         uris = self.source.uris
+        changed:bool = False
 
         for uri in values.split():
             if not util.url_validator(uri):
@@ -313,6 +335,7 @@ class Modify(Command):
                 
             if uri not in uris:
                 uris.append(uri)
+                changed = True
                 self.log.debug('Added URI %s', uri)
 
             else:
@@ -322,7 +345,7 @@ class Modify(Command):
                     self.repo
                 )
 
-        if uris != self.source.uris:
+        if changed:
             self.source.uris = uris
             return True
         return False
@@ -334,11 +357,13 @@ class Modify(Command):
         
         self.log.info('Removing URIs %s from source %s', values, self.repo)
         uris = self.source.uris
+        changed:bool = False
         self.log.debug('Starting uris: %s', uris)
 
         for uri in values.split():
             try:
                 uris.remove(uri)
+                changed = True
                 self.log.debug('Removed URI %s', uri)
 
             except ValueError:
@@ -355,7 +380,7 @@ class Modify(Command):
             )
             return False
         
-        if uris != self.source.uris:
+        if changed:
             self.source.uris = uris
             return True
         
@@ -368,10 +393,12 @@ class Modify(Command):
 
         self.log.info('Adding suites: %s', values)
         suites = self.source.suites
+        changed:bool = False
 
         for suite in values.split():
             if suite not in suites:
                 suites.append(suite)
+                changed = True
                 self.log.debug('Added suite %s', suite)
 
             else:
@@ -381,7 +408,7 @@ class Modify(Command):
                     self.repo
                 )
         
-        if suites != self.source.suites:
+        if changed:
             self.source.suites = suites
             return True
         return False
@@ -393,11 +420,13 @@ class Modify(Command):
         
         self.log.info('Removing suites %s from source %s', values, self.repo)
         suites = self.source.suites
+        changed:bool = False
         self.log.debug('Starting suites: %s', suites)
 
         for suite in values.split():
             try:
                 suites.remove(suite)
+                changed = True
                 self.log.debug('Removed suite %s', suite)
 
             except ValueError:
@@ -414,7 +443,7 @@ class Modify(Command):
             )
             return False
         
-        if suites != self.source.suites:
+        if changed:
             self.source.suites = suites
             return True
         
@@ -427,10 +456,12 @@ class Modify(Command):
 
         self.log.info('Adding components: %s', values)
         components = self.source.components
+        changed:bool = False
 
         for component in values.split():
             if component not in components:
                 components.append(component)
+                changed = True
                 self.log.debug('Added component %s', component)
 
             else:
@@ -447,7 +478,7 @@ class Modify(Command):
                     'supported. Consider converting the source to DEB822 format.'
                 )
 
-        if components != self.source.components:
+        if changed:
             self.source.components = components
             return True
         return False
@@ -459,11 +490,13 @@ class Modify(Command):
         
         self.log.info('Removing components %s from source %s', values, self.repo)
         components = self.source.components
+        changed:bool = False
         self.log.debug('Starting components: %s', components)
 
         for component in values.split():
             try:
                 components.remove(component)
+                changed = True
                 self.log.debug('Removed component %s', component)
 
             except ValueError:
@@ -480,7 +513,7 @@ class Modify(Command):
             )
             return False
         
-        if components != self.source.components:
+        if changed:
             self.source.components = components
             return True
         
@@ -77,12 +77,9 @@ class Remove(Command):
                 'Source %s was not found. Double-check the spelling',
                 self.source_name
             )
-            source_list:list = []
-            for source in util.sources:
-                source_list.append(source)
             suggested_source:str = self.source_name.replace(':', '-')
             suggested_source = suggested_source.translate(util.CLEAN_CHARS)
-            if not suggested_source in source_list:
+            if not suggested_source in util.sources:
                 return False
 
             response:str = input(f'Did you mean "{suggested_source}"? (Y/n) ')
@@ -105,18 +102,17 @@ class Remove(Command):
             response = input('Are you sure you want to do this? (y/N) ')
         
         if response in util.true_values:
+            # remove_source() saves the file itself
             self.file.remove_source(self.source_name)
-            self.file.save()
 
-            system.load_all_sources()
+            # The other sources are already loaded, so check them in memory
+            # instead of reading every source file again
+            util.sources.pop(self.source_name, None)
             for source in util.sources.values():
                 self.log.debug('Checking key for %s', source.ident)
-                try:
-                    if source.key.path == self.key.path:
-                        self.log.info('Source key in use with another source')
-                        return True
-                except AttributeError:
-                    pass
+                if source.key and self.key and source.key.path == self.key.path:
+                    self.log.info('Source key in use with another source')
+                    return True
             
             self.log.info('No other sources found using key, deleting key')
             if self.key:
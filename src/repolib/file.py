@@ -52,6 +52,16 @@ class SourceFile:
         contents(list): A list containing all of this file's contents
     """
 
+    __slots__ = (
+        'log',
+        'name',
+        'path',
+        'alt_path',
+        '_format',
+        'contents',
+        'sources',
+    )
+
     def __init__(self, name:str='') -> None:
         """Initialize a source file
         
@@ -116,10 +126,8 @@ class SourceFile:
             pass
         
         except PermissionError:
-            bus = dbus.SystemBus()
             try:
-                privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                privileged_object.delete_prefs_file(str(prefs_path))
+                util.call_privileged('delete_prefs_file', str(prefs_path))
             except dbus.exceptions.DBusException:
                 self.log.critical('DBus service not found!')
                 print("Permission denied. Please use `sudo`.")
@@ -354,16 +362,15 @@ class SourceFile:
                 
                 # Find 822 sources
                 # Valid sources can begin with any key:
-                for key in util.valid_keys:
-                    if line.startswith(key):
-                        if self.format == util.SourceFormat.LEGACY:
-                            raise SourceFileError(
-                                f'File {self.path.name} is a DEB822-format file, but '
-                                'contains legacy sources. This is not allowed. '
-                                'Please fix the file manually.'
-                            )
-                        parsing_deb822 = True
-                        raw822.append(line.strip())
+                if line.startswith(util.valid_keys):
+                    if self.format == util.SourceFormat.LEGACY:
+                        raise SourceFileError(
+                            f'File {self.path.name} is a DEB822-format file, but '
+                            'contains legacy sources. This is not allowed. '
+                            'Please fix the file manually.'
+                        )
+                    parsing_deb822 = True
+                    raw822.append(line.strip())
 
                 item += 1
             
@@ -452,17 +459,17 @@ class SourceFile:
 
         if len(self.sources) > 0:
             self.log.debug('Saving, Main path %s; Alt path: %s', self.path, self.alt_path)
+            # Serialize the file once, and write it out in a single call
+            output:str = self.output
             try:
                 with open(self.path, mode='w') as output_file:
-                    output_file.write(self.output)
+                    output_file.write(output)
                 if self.alt_path.exists():
                     self.alt_path.rename(save_path)
             
             except PermissionError:
-                bus = dbus.SystemBus()
                 try:
-                    privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                    privileged_object.output_file_to_disk(self.path.name, self.output)
+                    util.call_privileged('output_file_to_disk', self.path.name, output)
                 except dbus.exceptions.DBusException:
                     self.log.critical('DBus service not found!')
                     print("Permission denied. Please use `sudo`.")
@@ -474,10 +481,8 @@ class SourceFile:
                 self.alt_path.unlink(missing_ok=True)
                 save_path.unlink(missing_ok=True)
             except PermissionError:
-                bus = dbus.SystemBus()
                 try:
-                    privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                    privileged_object.delete_source_file(self.path.name)
+                    util.call_privileged('delete_source_file', self.path.name)
                 except dbus.exceptions.DBusException:
                     self.log.critical('DBus service not found!')
                     print("Permission denied. Please use `sudo`.")
@@ -508,10 +513,10 @@ class SourceFile:
         """Outputs the file in the output_legacy format"""
         legacy_output:str = ''
         for item in self.contents:
-            try:
-                legacy_output += item.legacy
-            except AttributeError:
+            if isinstance(item, str):
                 legacy_output += item
+            else:
+                legacy_output += item.legacy
             legacy_output += '\n'
         return legacy_output
 
@@ -520,11 +525,11 @@ class SourceFile:
         """Outputs the file in the output_822 format"""
         deb822_output:str = ''
         for item in self.contents:
-            try:
-                deb822_output += item.deb822
-            except AttributeError:
+            if isinstance(item, str):
                 deb822_output += item
                 deb822_output += '\n'
+            else:
+                deb822_output += item.deb822
         return deb822_output
 
 
@@ -533,10 +538,9 @@ class SourceFile:
         """Outputs the file in the output_ui format"""
         ui_output:str = ''
         for item in self.contents:
-            try:
+            # Skip file comments in UI mode
+            if not isinstance(item, str):
                 ui_output += item.ui
-            except AttributeError:
-                pass # Skip file comments in UI mode
             ui_output += '\n'
         return ui_output
 
@@ -546,14 +550,13 @@ class SourceFile:
         """Outputs the file in the output format"""
         default_output:str = ''
         for item in self.contents:
-            try:
-                if self.format == util.SourceFormat.DEFAULT:
-                    default_output += item.deb822
-                elif self.format == util.SourceFormat.LEGACY:
-                    default_output += item.legacy
-                    default_output += '\n'
-            except AttributeError:
+            if isinstance(item, str):
                 default_output += item
                 default_output += '\n'
+            elif self.format == util.SourceFormat.DEFAULT:
+                default_output += item.deb822
+            elif self.format == util.SourceFormat.LEGACY:
+                default_output += item.legacy
+                default_output += '\n'
         return default_output
 
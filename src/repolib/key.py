@@ -20,19 +20,27 @@ You should have received a copy of the GNU Lesser General Public License
 along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import filecmp
+import hashlib
 import logging
+import os
 import shutil
 
 import dbus
 import gnupg
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from urllib import request
+from urllib import error, request
 
 from . import util
 
 SKS_KEYSERVER = 'https://keyserver.ubuntu.com/'
 SKS_KEYLOOKUP_PATH = 'pks/lookup?op=get&options=mr&exact=on&search=0x'
 
+# All keys share one GnuPG home for the life of the process, rather than each
+# touching the user's own ~/.gnupg
+GPG_HOME = util.TEMP_DIR / 'gnupg'
+
 class KeyFileError(util.RepoError):
     """ Exceptions related to apt key files."""
 
@@ -52,12 +60,11 @@ class SourceKey:
         self.log = logging.getLogger(__name__)
         self.tmp_path = Path()
         self.path = Path()
-        self.gpg = gnupg.GPG()
+        self._gpg = None
         self.data = b''
         
         if name:
             self.reset_path(name=name)
-            self.setup_gpg()
     
     def reset_path(self, name: str = '', path:str = '', suffix: str = 'archive-keyring') -> None:
         """Set the path for this key
@@ -91,13 +98,49 @@ class SourceKey:
         self.log.debug('Copying %s to %s', self.path, self.tmp_path)
         try:
             shutil.copy2(self.path, self.tmp_path)
+            self.digest_path.unlink(missing_ok=True)
         
         except FileNotFoundError:
             pass
         
-        self.gpg = gnupg.GPG(keyring=str(self.tmp_path))
-        self.log.debug('GPG Setup: %s', self.gpg.keyring)
+        self._gpg = None
+
+    @property
+    def gpg(self) -> gnupg.GPG:
+        """The GPG object for this key's keyring, created on first use."""
+        if self._gpg is None:
+            keyring = str(self.tmp_path) if self.tmp_path.name else None
+            GPG_HOME.mkdir(mode=0o700, exist_ok=True)
+            self._gpg = gnupg.GPG(gnupghome=str(GPG_HOME), keyring=keyring)
+            self.log.debug('GPG Setup: %s', self._gpg.keyring)
+        return self._gpg
     
+    @property
+    def digest_path(self) -> Path:
+        """The path recording a digest of the data imported into tmp_path"""
+        return self.tmp_path.with_suffix(f'{self.tmp_path.suffix}.sha256')
+
+    def import_key_data(self, data) -> None:
+        """Import key data into the temporary keyring.
+
+        If the same data was already imported into the keyring, the import is
+        skipped so that gpg doesn't need to run again.
+
+        Arguments:
+            data(str|bytes): The key data to import
+        """
+        raw = data.encode() if isinstance(data, str) else data
+        digest = hashlib.sha256(raw).hexdigest()
+        try:
+            if self.tmp_path.stat().st_size and self.digest_path.read_text() == digest:
+                self.log.debug('Key data already imported into %s', self.tmp_path)
+                return
+        except OSError:
+            pass
+
+        self.gpg.import_keys(data)
+        self.digest_path.write_text(digest)
+
     def save_gpg(self) -> None:
         """Saves the key to disk."""
         self.log.info('Saving key file %s from %s', self.path, self.tmp_path)
@@ -111,14 +154,19 @@ class SourceKey:
                     'Key destination path does not exist and cannot be created '
                     'Failures expected now.'
                 )
+        if (
+            self.path.exists() and self.tmp_path.exists()
+            and filecmp.cmp(self.tmp_path, self.path, shallow=False)
+        ):
+            self.log.debug('Key file %s is unchanged, skipping', self.path)
+            return
         try:
-            shutil.copy(self.tmp_path, self.path)
+            self._install_key_file()
         
         except PermissionError:
-            bus = dbus.SystemBus()
             try:
-                privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                privileged_object.install_signing_key(
+                util.call_privileged(
+                    'install_signing_key',
                     str(self.tmp_path),
                     str(self.path)
                 )
@@ -127,6 +175,20 @@ class SourceKey:
                 print("Permission denied. Please use `sudo`.")
                 return
     
+    def _install_key_file(self) -> None:
+        """Atomically copy the temporary keyring into its final location.
+
+        The keyring is written alongside the destination first and then renamed
+        over it, so an interrupted copy never leaves a truncated keyring behind.
+        """
+        part_path = self.path.with_suffix(f'{self.path.suffix}.tmp')
+        try:
+            shutil.copy(self.tmp_path, part_path)
+            os.replace(part_path, self.path)
+        except Exception:
+            part_path.unlink(missing_ok=True)
+            raise
+    
     def delete_key(self) -> None:
         """Deletes the key file from disk."""
         try:
@@ -134,10 +196,8 @@ class SourceKey:
             self.path.unlink()
         
         except PermissionError:
-            bus = dbus.SystemBus()
             try:
-                privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                privileged_object.delete_signing_key(str(self.path))
+                util.call_privileged('delete_signing_key', str(self.path))
             except dbus.exceptions.DBusException:
                 self.log.critical('DBus service not found!')
                 print("Permission denied. Please use `sudo`.")
@@ -174,11 +234,11 @@ class SourceKey:
         
         if 'raw' in kwargs:
             self.data = kwargs['raw']
-            self.gpg.import_keys(self.data)
+            self.import_key_data(self.data)
             return
         
         if 'ascii' in kwargs:
-            self.gpg.import_keys(kwargs['ascii'])
+            self.import_key_data(kwargs['ascii'])
             if self.tmp_path.exists():
                 with open(self.tmp_path, mode='rb') as keyfile:
                     self.data = keyfile.read()
@@ -188,27 +248,118 @@ class SourceKey:
             req = request.Request(kwargs['url'])
             with request.urlopen(req) as response:
                 self.data = response.read().decode('UTF-8')
-                self.gpg.import_keys(self.data)
+                self.import_key_data(self.data)
             return
         
         if 'fingerprint' in kwargs:
-            if not 'keyserver' in kwargs:
-                kwargs['keyserver'] = SKS_KEYSERVER
-            
-            if not 'keypath' in kwargs:
-                kwargs['keypath'] = SKS_KEYLOOKUP_PATH
-            
-            key_url = kwargs['keyserver'] + kwargs['keypath'] + kwargs['fingerprint']
-            req = request.Request(key_url)
-            with request.urlopen(req) as response:
-                self.data = response.read().decode('UTF-8')
-                self.gpg.import_keys(self.data)
+            self.data = fetch_key_data(
+                kwargs['fingerprint'],
+                keyserver=kwargs.get('keyserver', SKS_KEYSERVER),
+                keypath=kwargs.get('keypath', SKS_KEYLOOKUP_PATH)
+            )
+            self.import_key_data(self.data)
             return
         
         raise TypeError(
             f'load_key_data() got an unexpected keyword argument "{kwargs.keys()}',
             ' Expected keyword arguments are: [raw, ascii, url, fingerprint]'
         )
-        
 
 
+def fetch_key_data(
+        fingerprint:str,
+        keyserver:str = SKS_KEYSERVER,
+        keypath:str = SKS_KEYLOOKUP_PATH) -> str:
+    """Download the key with the given fingerprint from a keyserver.
+
+    Arguments:
+        fingerprint(str): The fingerprint of the key to download
+        keyserver(str): The keyserver to download from
+        keypath(str): The path on the keyserver from which to download
+
+    Downloaded keys are cached, and the cached copy is revalidated with the
+    keyserver (using its ETag and modification time) so that an unchanged key
+    isn't downloaded again. Since the cache is writable by the user, the cached
+    copy is only used if it contains the requested key.
+
+    Returns:
+        str: The ASCII-armored key data
+    """
+    log = logging.getLogger(__name__)
+    cache_path = util.CACHE_DIR / 'keys' / f'{fingerprint}.asc'
+    etag_path = cache_path.with_suffix('.asc.etag')
+    url = keyserver + keypath + fingerprint
+
+    req = request.Request(url)
+    try:
+        cached_mtime = cache_path.stat().st_mtime
+        req.add_header('If-Modified-Since', formatdate(cached_mtime, usegmt=True))
+        req.add_header('If-None-Match', etag_path.read_text().strip())
+    except OSError:
+        pass
+
+    try:
+        data, etag, modified = _download_key(req)
+    except error.HTTPError as err:
+        if err.code != 304:
+            raise
+        try:
+            cached_data = cache_path.read_text()
+        except OSError:
+            cached_data = ''
+        if _key_data_matches(cached_data, fingerprint):
+            log.debug('Key %s is unchanged, using the cached copy', fingerprint)
+            return cached_data
+        log.warning(
+            'The cached copy of key %s does not contain it, downloading it again',
+            fingerprint
+        )
+        data, etag, modified = _download_key(request.Request(url))
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(data)
+        if modified:
+            mtime = parsedate_to_datetime(modified).timestamp()
+            os.utime(cache_path, (mtime, mtime))
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as err:
+        log.debug('Could not cache key %s: %s', fingerprint, err)
+
+    return data.decode('UTF-8')
+
+def _download_key(req:request.Request) -> tuple:
+    """Download key data, returning it with its ETag and Last-Modified headers"""
+    with request.urlopen(req) as response:
+        return (
+            response.read(),
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified')
+        )
+
+def _key_data_matches(data:str, fingerprint:str) -> bool:
+    """Check whether key data contains the key with the given fingerprint.
+
+    Arguments:
+        data(str): The ASCII-armored key data to check
+        fingerprint(str): The fingerprint (or long key ID) to look for. This
+            matches the primary key or any of its subkeys.
+
+    Returns: bool
+        `True` if the data contains the key, otherwise `False`.
+    """
+    fingerprint = fingerprint.replace(' ', '').upper()
+    if not data or not fingerprint:
+        return False
+    GPG_HOME.mkdir(mode=0o700, exist_ok=True)
+    gpg = gnupg.GPG(gnupghome=str(GPG_HOME))
+    for key in gpg.scan_keys_mem(data):
+        fingerprints = [key.get('fingerprint', '')]
+        fingerprints += [subkey[2] for subkey in key.get('subkeys', [])]
+        for key_fingerprint in fingerprints:
+            if key_fingerprint and key_fingerprint.upper().endswith(fingerprint):
+                return True
+    return False
@@ -21,11 +21,31 @@ along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import logging
+import re
 
 from . import util
 
 log = logging.getLogger(__name__)
 
+# A token is a run of non-space characters, where anything inside [...] (or an
+# unterminated [ through the end of the line) is kept together. This expects
+# whitespace to already be collapsed to single spaces.
+_TOKEN_RE = re.compile(r'(?:\[[^\]]*(?:\]|$)|[^\s\[])+')
+_ENCODE_BRACKETS = str.maketrans({'[': '%5B', ']': '%5D'})
+# Maps a one-line option name to its DEB822 key (or None if unsupported)
+_OPTION_KEY = util.options_inmap.get
+
+# The name is every token following the marker, up to the next marker or the
+# next token containing a '#'. The ident is the single token after its marker.
+_NAME_RE = re.compile(
+    r'(?<!\S)#*X-Repolib-Name\S*'
+    r'((?:\s+(?!#*X-Repolib-(?:Name|ID))[^\s#]+(?!\S))*)'
+)
+_IDENT_RE = re.compile(
+    r'(?<!\S)#*X-Repolib-ID\S*'
+    r'(?:\s+(?!#*X-Repolib-(?:Name|ID))([^\s#]+)(?!\S))?'
+)
+
 class DebParseError(util.RepoError):
     """ Exceptions related to parsing deb lines."""
 
@@ -46,33 +66,17 @@ def debsplit(line:str) -> list:
     Arguments:
         line(str): The line to split up.
     """
-    line = line.strip()
-    line_list = line.split()
-    for i in line_list:
-        if util.url_validator(i):
-            line_list[line_list.index(i)] = decode_brackets(i)
-    line = ' '.join(line_list)
-    pieces:list = []
-    tmp:str = ""
-    # we are inside a [..] block
-    p_found = False
-    for char in line:
-        if char == '[':
-            p_found = True
-            tmp += char
-        elif char == ']':
-            p_found = False
-            tmp += char
-        elif char.isspace() and not p_found:
-            pieces.append(tmp)
-            tmp = ''
-            continue
-        else:
-            tmp += char
-    # append last piece
-    if len(tmp) > 0:
-        pieces.append(tmp)
-    return pieces
+    if '[' not in line and '%5' not in line:
+        # Nothing to keep together or decode, so a plain split is equivalent
+        return line.split()
+    words:list = line.split()
+    url_validator = util.url_validator
+    for idx, word in enumerate(words):
+        if url_validator(word):
+            words[idx] = decode_brackets(word)
+    # Group on the whitespace-normalized line, so that bracketed tokens are
+    # joined with single spaces
+    return _TOKEN_RE.findall(' '.join(words))
 
 def encode_brackets(word:str) -> str:
     """ Encodes any [ and ] brackets into URL-safe form
@@ -87,9 +91,7 @@ def encode_brackets(word:str) -> str:
     Returns:
         `str`: the encoded string.
     """
-    word = word.replace('[', '%5B')
-    word = word.replace(']', '%5D')
-    return word
+    return word.translate(_ENCODE_BRACKETS)
 
 def decode_brackets(word:str) -> str:
     """ Un-encodes [ and ] from the input
@@ -104,6 +106,8 @@ def decode_brackets(word:str) -> str:
     Returns:
         `str`: the decoded string.
     """
+    if '%5' not in word:
+        return word
     word = word.replace('%5B', '[')
     word = word.replace('%5D', ']')
     return word
@@ -134,47 +138,24 @@ def parse_name_ident(tail:str) -> tuple:
     has_ident = 'X-Repolib-ID' in tail
     log.debug('Line ident found: %s', has_ident)
 
-    parts: list = tail.split()
-    name_found = False
-    ident_found = False
-    name:str = ''
-    ident:str = ''
-    comment:str = ''
-    for item in parts:
-        log.debug("Checking line item: %s", item)
-        item_is_name = item.strip('#').strip().startswith('X-Repolib-Name')
-        item_is_ident = item.strip('#').strip().startswith('X-Repolib-ID')
-        
-        if '#' in item and not item_is_name and not item_is_ident:
-            name_found = False
-            ident_found = False
-        
-        elif item_is_name:
-            name_found = True
-            ident_found = False
-            continue
-        
-        elif item_is_ident:
-            name_found = False
-            ident_found = True
-            continue
-        
-        if name_found and not item_is_name:
-            name += f'{item} '
-            continue
-        
-        elif ident_found and not item_is_ident:
-            ident += f'{item}'
-            ident_found = False
-            continue
-        
-        elif not name_found and not ident_found:
-            c = item.strip('#')
-            comment += f'{c} '
+    name_parts:list = []
+    ident_parts:list = []
 
-    name = name.strip()
-    ident = ident.strip()
-    comment = comment.strip()
+    def take_name(match) -> str:
+        name_parts.append(match.group(1))
+        return ' '
+
+    def take_ident(match) -> str:
+        if match.group(1):
+            ident_parts.append(match.group(1))
+        return ' '
+
+    rest:str = _NAME_RE.sub(take_name, tail)
+    rest = _IDENT_RE.sub(take_ident, rest)
+
+    name:str = ' '.join(' '.join(name_parts).split())
+    ident:str = ''.join(ident_parts)
+    comment:str = ' '.join(item.strip('#') for item in rest.split()).strip()
 
     if not name:
         if ident: 
@@ -229,12 +210,15 @@ class ParseDeb:
         parsed_options:dict = {}
 
         for opt in options:
-            pre_key, values = opt.split('=')
-            values = values.split(',')
-            value:str = ' '.join(values)
-            try:
-                key:str = util.options_inmap[pre_key]
-            except KeyError:
+            pre_key, sep, values = opt.partition('=')
+            if not sep:
+                raise DebParseError(
+                    f'Could not parse line {self.curr_line}: option {opt} is '
+                    'missing a value.'
+                )
+            value:str = values.replace(',', ' ')
+            key = _OPTION_KEY(pre_key)
+            if key is None:
                 raise DebParseError(
                     f'Could not parse line {self.curr_line}: option {opt} is '
                     'not a valid debian repository option or is unsupported.'
@@ -307,28 +291,14 @@ class ParseDeb:
         else:
             raise DebParseError(f'The line "{self.curr_line}" is of invalid type.')
 
-        # Determine the properties of our repo line
-        uri_index:int = 0
-        is_cdrom: bool = False
-        ## The URI index is the vital piece of information we need to parse the 
-        ## deb line, as it's position determines what other components are 
-        ## present and where they are. This determines the location of the URI
-        ## regardless of where it's at.
-        for part in parts:
-            if part.startswith('['):
-                if 'cdrom' in part:
-                    is_cdrom = True
-                    uri_index = parts.index(part)
-                else:
-                    uri_index = 1
-        
-        if is_cdrom:
-            # This could maybe change if the parser now differentiates between 
-            # CDROM URIs and option lists
-            raise DebParseError('Repolib cannot currently accept CDROM Sources')
-
-        if uri_index != 0:
-            line_parsed['options'] = self.parse_options(parts.pop(0))
+        # Options, if present, always directly follow the repo type
+        if parts and parts[0].startswith('['):
+            opts_part:str = parts.pop(0)
+            if 'cdrom:' in opts_part:
+                # This could maybe change if the parser now differentiates
+                # between CDROM URIs and option lists
+                raise DebParseError('Repolib cannot currently accept CDROM Sources')
+            line_parsed['options'] = self.parse_options(opts_part)
         
         if len(line_parsed) < 2: # Should have at minimum a URI and a suite/path
             raise DebParseError(
@@ -347,9 +317,7 @@ class ParseDeb:
 
         line_parsed['suite'] = parts.pop(0)
         
-        line_components:list = []
-        for comp in parts:
-            line_parsed['components'].append(comp)
+        line_parsed['components'] = list(parts)
         
         
         has_type = line_parsed['repo_type']
@@ -359,10 +327,10 @@ class ParseDeb:
         if has_type and has_uri and has_suite:
             # if we have these three minimum components, we can proceed and the
             # line is valid. Otherwise, error out.
-            return line_parsed.copy()
+            return line_parsed
         
         if self.debug:
-            return line_parsed.copy()
+            return line_parsed
         
         raise DebParseError(
             f'The line {self.curr_line} could not be parsed due to an '
@@ -106,10 +106,8 @@ class PopdevSource(Source):
             with open(self.prefs, mode='w') as prefs_file:
                 prefs_file.write(prefs_contents)
         except PermissionError:
-            bus = dbus.SystemBus()
             try:
-                privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-                privileged_object.output_prefs_to_disk(str(self.prefs), prefs_contents)
+                util.call_privileged('output_prefs_to_disk', str(self.prefs), prefs_contents)
             except dbus.exceptions.DBusException:
                 self.log.critical('DBus service not found!')
                 print("Permission denied. Please use `sudo`.")
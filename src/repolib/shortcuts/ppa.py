@@ -20,7 +20,16 @@ You should have received a copy of the GNU Lesser General Public License
 along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import base64
+import functools
+import gzip
+import http.client
+import json
 import logging
+import threading
+import time
+
+from urllib import error, parse, request
 
 from repolib.key import SourceKey
 
@@ -32,10 +41,8 @@ try:
     from launchpadlib.launchpad import Launchpad
     from lazr.restfulclient.errors import BadRequest, NotFound, Unauthorized
 except ImportError:
-    raise SourceError(
-        'Missing optional dependency "launchpadlib". Try `sudo apt install '
-        'python3-launchpadlib` to install it.'
-    )
+    # The REST API is used directly; launchpadlib is only a fallback
+    Launchpad = None
 
 BASE_FORMAT = util.SourceFormat.LEGACY
 BASE_URL = 'http://ppa.launchpad.net'
@@ -44,6 +51,16 @@ BASE_COMPS = 'main'
 
 DEFAULT_FORMAT = util.SourceFormat.LEGACY
 
+LP_CACHE_TTL = 24 * 60 * 60 # Seconds before cached PPA metadata is refetched
+LP_API_HOST = 'api.launchpad.net'
+LP_API_PATH = '/devel/'
+LP_API_ROOT = f'https://{LP_API_HOST}{LP_API_PATH}'
+LP_API_TIMEOUT = 30
+
+# Keep-alive connections to the Launchpad API, one per thread since an
+# http.client connection can't be shared between threads.
+_lp_local = threading.local()
+
 prefix = 'ppa'
 delineator = ':'
 
@@ -195,6 +212,7 @@ class PPA:
     """
 
     def __init__(self, teamname, ppaname):
+        self.log = logging.getLogger(__name__)
         self.teamname = teamname
         self.ppaname = ppaname
         self._lap = None
@@ -202,11 +220,88 @@ class PPA:
         self._lpppa = None
         self._signing_key_data = None
         self._fingerprint = None
+        self._description = None
+        self._displayname = None
+        self.load_cache()
+
+    @property
+    def cache_path(self):
+        """ Path: The on-disk metadata cache file for this PPA."""
+        return util.CACHE_DIR / 'launchpad' / f'{self.teamname}_{self.ppaname}.json'
+
+    def load_cache(self) -> None:
+        """ Load recently fetched metadata for this PPA from disk, if present."""
+        try:
+            if time.time() - self.cache_path.stat().st_mtime > LP_CACHE_TTL:
+                return
+            with open(self.cache_path, mode='r') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(cache, dict):
+            return
+
+        self._description = cache.get('description')
+        self._displayname = cache.get('displayname')
+        self._fingerprint = cache.get('fingerprint')
+        self.log.debug('Loaded cached Launchpad data for %s/%s', self.teamname, self.ppaname)
+
+    def save_cache(self) -> None:
+        """ Save the fetched metadata for this PPA to disk."""
+        cache = {
+            'description': self._description,
+            'displayname': self._displayname,
+            'fingerprint': self._fingerprint,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, mode='w') as cache_file:
+                json.dump(cache, cache_file)
+        except OSError as err:
+            self.log.debug('Could not cache Launchpad data: %s', err)
+
+    def fetch_metadata(self) -> None:
+        """ Fetch the metadata for this PPA from Launchpad and cache it."""
+        try:
+            ppa_data = _lp_get(
+                f'~{parse.quote(self.teamname)}/+archive/ubuntu/'
+                f'{parse.quote(self.ppaname)}'
+            )
+        except error.HTTPError as err:
+            if err.code == 404:
+                msg = f'PPA "{self.teamname}/{self.ppaname}" not found'
+                raise SourceError(msg) from err
+            ppa_data = self._fetch_metadata_lplib(err)
+        except (error.URLError, http.client.HTTPException, OSError, ValueError) as err:
+            ppa_data = self._fetch_metadata_lplib(err)
+
+        self._description = ppa_data.get('description') or ''
+        self._displayname = ppa_data.get('displayname') or ''
+        self._fingerprint = ppa_data.get('signing_key_fingerprint')
+        self.save_cache()
+
+    def _fetch_metadata_lplib(self, err:Exception) -> dict:
+        """ Fetch the metadata using launchpadlib, if the REST API failed."""
+        if Launchpad is None:
+            raise SourceError(
+                f'Could not get PPA information from Launchpad: {err}'
+            ) from err
+        self.log.debug('Launchpad API request failed (%s), trying launchpadlib', err)
+        return {
+            'description': self.lpppa.description,
+            'displayname': self.lpppa.displayname,
+            'signing_key_fingerprint': self.lpppa.signing_key_fingerprint,
+        }
 
     @property
     def lap(self):
         """ The Launchpad Object."""
         if not self._lap:
+            if Launchpad is None:
+                raise SourceError(
+                    'Missing optional dependency "launchpadlib". Try `sudo apt '
+                    'install python3-launchpadlib` to install it.'
+                )
             self._lap = Launchpad.login_anonymously(
                 f'{self.__module__}.{self.__class__.__name__}',
                 service_root='production',
@@ -245,21 +340,116 @@ class PPA:
     @property
     def description(self) -> str:
         """str: The description of the PPA."""
-        return self.lpppa.description or ''
+        if self._description is None:
+            self.fetch_metadata()
+        return self._description
 
     @property
     def displayname(self) -> str:
         """ str: the fancy name of the PPA."""
-        return self.lpppa.displayname or ''
+        if self._displayname is None:
+            self.fetch_metadata()
+        return self._displayname
 
     @property
     def fingerprint(self):
         """ str: the fingerprint of the signing key."""
         if not self._fingerprint:
-            self._fingerprint = self.lpppa.signing_key_fingerprint
+            self.fetch_metadata()
         return self._fingerprint
 
 
+def _lp_connection(reset:bool = False) -> http.client.HTTPSConnection:
+    """ Get this thread's persistent connection to the Launchpad API.
+
+    The connection is tunnelled through the HTTPS proxy from the environment
+    (https_proxy), unless no_proxy excludes the Launchpad API host.
+
+    Arguments:
+        reset (bool): Close any existing connection and open a new one.
+    """
+    conn = getattr(_lp_local, 'conn', None)
+    if conn is not None and reset:
+        _lp_drop_connection()
+        conn = None
+    if conn is None:
+        proxy = request.getproxies().get('https')
+        if proxy and not request.proxy_bypass(LP_API_HOST):
+            proxy_url = parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+            conn = http.client.HTTPSConnection(
+                proxy_url.hostname, proxy_url.port or 80, timeout=LP_API_TIMEOUT
+            )
+            tunnel_headers = {}
+            if proxy_url.username:
+                credentials = (
+                    f'{parse.unquote(proxy_url.username)}:'
+                    f'{parse.unquote(proxy_url.password or "")}'
+                )
+                tunnel_headers['Proxy-Authorization'] = (
+                    'Basic ' + base64.b64encode(credentials.encode()).decode()
+                )
+            conn.set_tunnel(LP_API_HOST, headers=tunnel_headers)
+        else:
+            conn = http.client.HTTPSConnection(LP_API_HOST, timeout=LP_API_TIMEOUT)
+        _lp_local.conn = conn
+    return conn
+
+def _lp_drop_connection() -> None:
+    """ Close and forget this thread's connection to the Launchpad API."""
+    conn = getattr(_lp_local, 'conn', None)
+    _lp_local.conn = None
+    if conn is not None:
+        conn.close()
+
+def _lp_request(path:str, headers:dict, reset:bool = False) -> tuple:
+    """ Send a GET request to the Launchpad API and read the whole response.
+
+    If anything fails part way through, the connection could be left with a
+    request sent or a response half read, so it is dropped rather than reused
+    by this thread's next request.
+
+    Returns:
+        tuple: The response object and its body.
+    """
+    conn = _lp_connection(reset=reset)
+    try:
+        conn.request('GET', LP_API_PATH + path, headers=headers)
+        response = conn.getresponse()
+        return response, response.read()
+    except Exception:
+        _lp_drop_connection()
+        raise
+
+def _lp_get(path:str) -> dict:
+    """ Fetch a resource from the Launchpad REST API.
+
+    Requests reuse a kept-alive connection where possible, and ask for a
+    gzip-compressed response.
+
+    Arguments:
+        path (str): The resource path, relative to LP_API_ROOT.
+
+    Returns:
+        dict: The decoded JSON representation of the resource.
+    """
+    url = LP_API_ROOT + path
+    headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip'}
+    try:
+        response, body = _lp_request(path, headers)
+    except (http.client.RemoteDisconnected, ConnectionError):
+        # The server closed the idle connection, so retry once on a new one
+        response, body = _lp_request(path, headers, reset=True)
+
+    if response.status != 200:
+        raise error.HTTPError(
+            url, response.status, response.reason, response.headers, None
+        )
+    if response.getheader('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return json.loads(body)
+
+
+@functools.lru_cache(maxsize=256)
 def get_info_from_lp(owner_name, ppa):
     """ Attempt to get information on a PPA from launchpad over the internet.
 
@@ -21,6 +21,7 @@ along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import logging
+import re
 from pathlib import Path
 
 from debian import deb822
@@ -31,6 +32,32 @@ from . import util
 
 DEFAULT_FORMAT = util.SourceFormat.LEGACY
 
+# ParseDeb only keeps the last lines it saw for error reporting, so one parser
+# can be shared by every source rather than built for each line loaded
+_DEB_PARSER = ParseDeb()
+
+_URI_SPLIT = re.compile(r'/+').split
+
+def _option_property(key:str, doc:str) -> property:
+    """Create a property for a source option stored in the DEB822 field `key`
+
+    Unset options read as an empty string, and setting an option to an empty
+    value removes it.
+
+    Arguments:
+        key(str): The DEB822 field for the option
+        doc(str): The docstring for the property
+    """
+    def getter(self) -> str:
+        return self[key] if key in self else ''
+
+    def setter(self, data) -> None:
+        self.pop(key, None)
+        if data:
+            self[key] = data
+
+    return property(getter, setter, doc=doc)
+
 class SourceError(util.RepoError):
     """ Exception from a source object."""
 
@@ -62,6 +89,22 @@ class Source(deb822.Deb822):
 
     default_format = DEFAULT_FORMAT
 
+    # Deb822 still gives each instance a __dict__, but the attributes Source
+    # itself adds are stored in slots
+    __slots__ = (
+        'log',
+        'file',
+        'key',
+        'comments',
+        'twin_source',
+        'twin_enabled',
+        '_options',
+        '_parsed_fields',
+        '_output_cache',
+        '_generation',
+        '_options_generation',
+    )
+
     @staticmethod
     def validator(shortcut:str) -> bool:
         """Determine whether a deb line is valid.
@@ -91,35 +134,37 @@ class Source(deb822.Deb822):
     def __init__(self, *args, file=None, **kwargs) -> None:
         """Initialize this source object"""
         self.log = logging.getLogger(__name__)
+        self._parsed_fields:dict = {}
+        self._output_cache:dict = {}
+        self._generation:int = 0
+        self._options_generation:int = -1
         super().__init__(*args, **kwargs)
         self.reset_values()
         self.file = file
         self.twin_source = False
         self.twin_enabled = False
     
+    def __setitem__(self, key, value) -> None:
+        self._generation += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._generation += 1
+        super().__delitem__(key)
+
     def __repr__(self):
         """type: () -> str"""
         # Append comments to the item
         # if self.options:
 
+        items:dict = dict(self.items())
         if self.comments:
-            self['Comments'] = '# '
-            self['Comments'] += ' # '.join(self.comments)
+            items['Comments'] = '# ' + ' # '.join(self.comments)
 
-        rep:str = '{%s}' % ', '.join(['%r: %r' % (k, v) for k, v in self.items()])
-
-        rep:str = '{'
-        for key in self:
-            rep += f"{util.PRETTY_PRINT}'{key}': '{self[key]}', "
-
-        rep = rep[:-2]
-        rep += f"{util.PRETTY_PRINT.replace(' ', '')}"
-        rep += '}'
-
-        if self.comments:
-            self.pop('Comments')
-
-        return rep
+        rep:str = ', '.join(
+            f"{util.PRETTY_PRINT}'{key}': '{value}'" for key, value in items.items()
+        )
+        return f"{{{rep}{util.PRETTY_PRINT.replace(' ', '')}}}"
     
     def __bool__(self) -> bool:
         has_uri:bool = len(self.uris) > 0
@@ -167,30 +212,20 @@ class Source(deb822.Deb822):
     def reset_values(self) -> None:
         """Reset the default values for all attributes"""
         self.log.info('Resetting source info')
-        self.ident = ''
-        self.name = ''
-        self.enabled = True
-        self.types = [util.SourceType.BINARY]
-        self.uris = []
-        self.suites = []
-        self.components = []
+        # Set the fields directly, since each option setter would otherwise
+        # rebuild the legacy options again
+        self.update({
+            'X-Repolib-ID': '',
+            'X-Repolib-Name': '',
+            'Enabled': 'yes',
+            'Types': util.SourceType.BINARY.value,
+            'URIs': '',
+            'Suites': '',
+            'Components': '',
+        })
+        for key in (*util.options_outmap, 'X-Repolib-Prefs'):
+            self.pop(key, None)
         self.comments = []
-        self.signed_by = None
-        self.architectures = ''
-        self.languages = ''
-        self.targets = ''
-        self.pdiffs = ''
-        self.by_hash = ''
-        self.allow_insecure = ''
-        self.allow_weak = ''
-        self.allow_downgrade_to_insecure = ''
-        self.trusted = ''
-        self.signed_by = ''
-        self.check_valid_until = ''
-        self.valid_until_min = ''
-        self.valid_until_max = ''
-        self.prefs = ''
-        self._update_legacy_options()
         self.file = None
         self.key = None
 
@@ -206,14 +241,16 @@ class Source(deb822.Deb822):
         self.log.info('Loading source from data')
         self.reset_values()
         
-        if util.validate_debline(data[0]): # Legacy Source
+        # DEB822 data starts with one of its field names, which a legacy line
+        # never does, so there's no need to check it as a deb line
+        is_deb822 = data[0].startswith(util.valid_keys)
+        if not is_deb822 and util.validate_debline(data[0]): # Legacy Source
             if len(data) > 1:
                 raise SourceError(
                     f'The source is a legacy source but contains {len(data)} entries. '
                     'It may only contain one entry.'
                 )
-            deb_parser = ParseDeb()
-            parsed_debline = deb_parser.parse_line(data[0])
+            parsed_debline = _DEB_PARSER.parse_line(data[0])
             self.ident = parsed_debline['ident']
             self.name = parsed_debline['name']
             self.enabled = parsed_debline['enabled']
@@ -221,9 +258,8 @@ class Source(deb822.Deb822):
             self.uris = [parsed_debline['uri']]
             self.suites = [parsed_debline['suite']]
             self.components = parsed_debline['components']
-            for key in parsed_debline['options']:
-                self[key] = parsed_debline['options'][key]
-            self._update_legacy_options()
+            for key, value in parsed_debline['options'].items():
+                self[key] = value
             for comment in parsed_debline['comments']:
                 self.comments.append(comment)
             if self.comments == ['']:
@@ -245,9 +281,8 @@ class Source(deb822.Deb822):
     @property
     def sourcecode_enabled(self) -> bool:
         """`True` if this source also provides source code, otherwise `False`"""
-        if util.SourceType.SOURCECODE in self.types:
-            return True
-        return False
+        # deb-src is the only type containing this, so skip parsing the types
+        return util.SourceType.SOURCECODE.value in self.get('Types', '')
     
     @sourcecode_enabled.setter
     def sourcecode_enabled(self, enabled) -> None:
@@ -265,17 +300,13 @@ class Source(deb822.Deb822):
             A sane default-id
         """
         ident:str = ''
-        if len(self.uris) > 0:
-            uri:str = self.uris[0].replace('/', ' ')
-            uri_list:list = uri.split()
-            uri_str:str = '-'.join(uri_list[1:])
-            branch_name:str = util.scrub_filename(uri_str)
+        uris:list = self.uris
+        if uris:
+            uri_list:list = _URI_SPLIT(uris[0].strip('/'))
+            branch_name:str = util.scrub_filename('-'.join(uri_list[1:]))
             ident = f'{prefix}{branch_name}'
         ident += f'-{self.types[0].ident()}'
-        try:
-            if not self['X-Repolib-ID']:
-                self['X-Repolib-ID'] = ident
-        except KeyError:
+        if not self.get('X-Repolib-ID'):
             self['X-Repolib-ID'] = ident
         return ident
     
@@ -285,13 +316,7 @@ class Source(deb822.Deb822):
         Returns: str
             A name based on the ident
         """
-        name:str = self.ident
-        try:
-            name = self['X-Repolib-Name']
-        except KeyError:
-            self['X-Repolib-Name'] = self.ident
-            return self['X-Repolib-Name']
-
+        name:str = self.get('X-Repolib-Name', '')
         if not name:
             self['X-Repolib-Name'] = self.ident
         
@@ -352,42 +377,78 @@ class Source(deb822.Deb822):
         """
         return self.ui
     
-    def prop_append(self, prop:list, item:str) -> None:
-        """Appends an item to a list property of this source.
-        NOTE: List properties are `types`, `uris`, `suites`, and `components`.
+    def _append_field(self, key:str, item:str) -> None:
+        """Appends an item to a space-separated field of this source.
 
         Arguments:
-            prop(list): The property on which to append the item.
-            item(str): The item to append to the propery
+            key(str): The field to append to
+            item(str): The item to append
         """
-        _list = prop
-        _list.append(item)
-        prop = _list
+        self[key] = f'{self.get(key, "")} {item}'.strip()
+
+    def add_uri(self, uri:str) -> None:
+        """Appends a URI to this source.
+
+        Arguments:
+            uri(str): The URI to add
+        """
+        self._append_field('URIs', uri)
+
+    def add_suite(self, suite:str) -> None:
+        """Appends a suite to this source.
+
+        Arguments:
+            suite(str): The suite to add
+        """
+        self._append_field('Suites', suite)
+
+    def add_component(self, component:str) -> None:
+        """Appends a component to this source.
+
+        Arguments:
+            component(str): The component to add
+        """
+        self._append_field('Components', component)
 
     def tasks_save(self, *args, **kwargs) -> None:
         """Extra tasks to perform when saving a source"""
         return
 
+    def _parsed_field(self, key:str, parse=str.split) -> list:
+        """Get the list of values parsed from a space-separated field.
+
+        The parsed values are cached until the raw field value changes.
+
+        Arguments:
+            key(str): The field to parse
+            parse(callable): Turns the raw field value into a list of values
+        """
+        try:
+            raw = self[key]
+        except KeyError:
+            return []
+        cached = self._parsed_fields.get(key)
+        if cached is None or cached[0] != raw:
+            cached = (raw, tuple(parse(raw)))
+            self._parsed_fields[key] = cached
+        return list(cached[1])
+
     ## Properties are stored/retrieved from the underlying Deb822 dict
     @property
     def has_required_parts(self) -> bool:
         """(RO) True if all required attributes are set, otherwise false."""
-        required_parts = ['uris', 'suites', 'ident']
-
-        for attr in required_parts:
-            if len(getattr(self, attr)) < 1:
-                return False
-        
-        return True
+        # Check the raw fields, since this is read on every `enabled` access
+        return bool(
+            self.get('URIs', '').strip()
+            and self.get('Suites', '').strip()
+            and self.get('X-Repolib-ID')
+        )
 
 
     @property
     def ident(self) -> str:
         """The ident for this source within the file"""
-        try:
-            return self['X-Repolib-ID']
-        except KeyError:
-            return ''
+        return self.get('X-Repolib-ID', '')
             
 
     @ident.setter
@@ -399,14 +460,10 @@ class Source(deb822.Deb822):
     @property
     def name(self) -> str: 
         """The human-friendly name for this source"""
-        try:
-            _name = self['X-Repolib-Name']
-        except KeyError:
-            _name = ''
-
-        if not _name:
-            self.generate_default_name()
-        return self['X-Repolib-Name']
+        _name = self.get('X-Repolib-Name', '')
+        if _name:
+            return _name
+        return self.generate_default_name()
     
     @name.setter
     def name(self, name: str) -> None:
@@ -416,54 +473,47 @@ class Source(deb822.Deb822):
     @property
     def enabled(self) -> util.AptSourceEnabled:
         """Whether or not the source is enabled/active"""
-        try:
-            enabled = self['Enabled'] in util.true_values
-        except KeyError:
-            return util.AptSourceEnabled.FALSE
-        
-        if enabled and self.has_required_parts:
+        if self._enabled_bool:
             return util.AptSourceEnabled.TRUE
         return util.AptSourceEnabled.FALSE
     
     @enabled.setter
     def enabled(self, enabled) -> None:
         """For convenience, accept a wide varietry of input value types"""
-        self['Enabled'] = 'no'
-        if enabled in util.true_values:
-            self['Enabled'] = 'yes'
+        value:str = 'yes' if enabled in util.true_values else 'no'
+        # Rewriting the same value would still invalidate the cached output
+        if self.get('Enabled') != value:
+            self['Enabled'] = value
+
+    @property
+    def _enabled_bool(self) -> bool:
+        """`enabled` as a plain bool, for internal checks"""
+        return self.get('Enabled') in util.true_values and self.has_required_parts
     
 
     @property
     def types(self) -> list:
         """The list of source types for this source"""
-        _types:list = []
-        try:
-            for sourcetype in self['types'].split():
-                _types.append(util.SourceType(sourcetype))
-        except KeyError:
-            pass
-        return _types
+        return self._parsed_field(
+            'Types', lambda raw: [
+                # Unknown values still go through SourceType to raise ValueError
+                util._SRC_TYPE_MAP.get(value) or util.SourceType(value)
+                for value in raw.split()
+            ]
+        )
     
     @types.setter
     def types(self, types: list) -> None:
         """Turn this list into a string of values for storage"""
-        self['Types'] = ''
-        _types:list = []
-        for sourcetype in types:
-            if sourcetype not in _types:
-                _types.append(sourcetype)
-        for sourcetype in _types:
-            self['Types'] += f'{sourcetype.value} '
-        self['Types'] = self['Types'].strip()
+        self['Types'] = ' '.join(
+            sourcetype.value for sourcetype in dict.fromkeys(types)
+        )
     
 
     @property
     def uris(self) -> list:
         """The list of URIs for this source"""
-        try:
-            return self['URIs'].split()
-        except KeyError:
-            return []
+        return self._parsed_field('URIs')
     
     @uris.setter
     def uris(self, uris: list) -> None:
@@ -473,10 +523,7 @@ class Source(deb822.Deb822):
     @property
     def suites(self) -> list:
         """The list of URIs for this source"""
-        try:
-            return self['Suites'].split()
-        except KeyError:
-            return []
+        return self._parsed_field('Suites')
     
     @suites.setter
     def suites(self, suites: list) -> None:
@@ -486,10 +533,7 @@ class Source(deb822.Deb822):
     @property
     def components(self) -> list:
         """The list of URIs for this source"""
-        try:
-            return self['Components'].split()
-        except KeyError:
-            return []
+        return self._parsed_field('Components')
     
     @components.setter
     def components(self, components: list) -> None:
@@ -498,25 +542,18 @@ class Source(deb822.Deb822):
 
     @property
     def options(self) -> dict:
-        """The options for this source"""
+        """The one-line options for this source (read-only)
+
+        These are built from the source's fields; set an option through its
+        own property (e.g. `signed_by`) instead.
+        """
+        self._update_legacy_options()
         return self._options
     
-    @options.setter
-    def options(self, options:dict) -> None:
-        if 'Signed-By' in options:
-            self.signed_by = options['Signed-By']
-            if self.signed_by:
-                options.pop('Signed-By')
-        self._options = options
-    
     @property
     def prefs(self):
         """The path to any apt preferences files for this source."""
-        try:
-            prefs = self['X-Repolib-Prefs']
-        except KeyError: 
-            prefs = ''
-        
+        prefs = self.get('X-Repolib-Prefs', '')
         if prefs:
             return Path(prefs)
         return Path()
@@ -524,313 +561,94 @@ class Source(deb822.Deb822):
     @prefs.setter
     def prefs(self, prefs):
         """Accept a str or a Path-like object"""
-        try:
-            del self['X-Repolib-Prefs']
-        except KeyError:
-            pass
-        
+        self.pop('X-Repolib-Prefs', None)
         if prefs:
             prefs_str = str(prefs)
             self['X-Repolib-Prefs'] = prefs_str
     
 
     ## Option properties
+    architectures = _option_property('Architectures', 'architectures option')
+    languages = _option_property('Languages', 'languages option')
+    targets = _option_property('Targets', 'targets option')
+    pdiffs = _option_property('Pdiffs', 'pdiffs option')
+    by_hash = _option_property('By-Hash', 'by_hash option')
+    allow_insecure = _option_property('Allow-Insecure', 'allow_insecure option')
+    allow_weak = _option_property('Allow-Weak', 'allow_weak option')
+    allow_downgrade_to_insecure = _option_property(
+        'Allow-Downgrade-To-Insecure', 'allow_downgrade_to_insecure option'
+    )
+    trusted = _option_property('Trusted', 'trusted option')
+    signed_by = _option_property('Signed-By', 'signed_by option')
+    check_valid_until = _option_property('Check-Valid-Until', 'check_valid_until option')
+    valid_until_min = _option_property('Valid-Until-Min', 'valid_until_min option')
+    valid_until_max = _option_property('Valid-Until-Max', 'valid_until_max option')
 
-    @property
-    def architectures (self) -> str:
-        """architectures option"""
-        try:
-            return self['Architectures']
-        except KeyError:
-            return ''
-    
-    @architectures.setter
-    def architectures(self, data) -> None:
-        try:
-            self.pop('Architectures')
-        except KeyError:
-            pass
-
-        if data:
-            self['Architectures'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def languages (self) -> str:
-        """languages option"""
-        try:
-            return self['Languages']
-        except KeyError:
-            return ''
-    
-    @languages.setter
-    def languages(self, data) -> None:
-        try:
-            self.pop('Languages')
-        except KeyError:
-            pass
-
-        if data:
-            self['Languages'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def targets (self) -> str:
-        """targets option"""
-        try:
-            return self['Targets']
-        except KeyError:
-            return ''
-    
-    @targets.setter
-    def targets(self, data) -> None:
-        try:
-            self.pop('Targets')
-        except KeyError:
-            pass
-
-        if data:
-            self['Targets'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def pdiffs (self) -> str:
-        """pdiffs option"""
-        try:
-            return self['Pdiffs']
-        except KeyError:
-            return ''
-    
-    @pdiffs.setter
-    def pdiffs(self, data) -> None:
-        try:
-            self.pop('Pdiffs')
-        except KeyError:
-            pass
-
-        if data:
-            self['Pdiffs'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def by_hash (self) -> str:
-        """by_hash option"""
-        try:
-            return self['By-Hash']
-        except KeyError:
-            return ''
-    
-    @by_hash.setter
-    def by_hash(self, data) -> None:
-        try:
-            self.pop('By-Hash')
-        except KeyError:
-            pass
-
-        if data:
-            self['By-Hash'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def allow_insecure (self) -> str:
-        """allow_insecure option"""
-        try:
-            return self['Allow-Insecure']
-        except KeyError:
-            return ''
-    
-    @allow_insecure.setter
-    def allow_insecure(self, data) -> None:
-        try:
-            self.pop('Allow-Insecure')
-        except KeyError:
-            pass
-
-        if data:
-            self['Allow-Insecure'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def allow_weak (self) -> str:
-        """allow_weak option"""
-        try:
-            return self['Allow-Weak']
-        except KeyError:
-            return ''
-    
-    @allow_weak.setter
-    def allow_weak(self, data) -> None:
-        try:
-            self.pop('Allow-Weak')
-        except KeyError:
-            pass
-
-        if data:
-            self['Allow-Weak'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def allow_downgrade_to_insecure (self) -> str:
-        """allow_downgrade_to_insecure option"""
-        try:
-            return self['Allow-Downgrade-To-Insecure']
-        except KeyError:
-            return ''
-    
-    @allow_downgrade_to_insecure.setter
-    def allow_downgrade_to_insecure(self, data) -> None:
-        try:
-            self.pop('Allow-Downgrade-To-Insecure')
-        except KeyError:
-            pass
-
-        if data:
-            self['Allow-Downgrade-To-Insecure'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def trusted (self) -> str:
-        """trusted option"""
-        try:
-            return self['Trusted']
-        except KeyError:
-            return ''
-    
-    @trusted.setter
-    def trusted(self, data) -> None:
-        try:
-            self.pop('Trusted')
-        except KeyError:
-            pass
-
-        if data:
-            self['Trusted'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def signed_by (self) -> str:
-        """signed_by option"""
-        try:
-            return self['Signed-By']
-        except KeyError:
-            return ''
-    
-    @signed_by.setter
-    def signed_by(self, data) -> None:
-        try:
-            self.pop('Signed-By')
-        except KeyError:
-            pass
-
-        if data:
-            self['Signed-By'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def check_valid_until (self) -> str:
-        """check_valid_until option"""
-        try:
-            return self['Check-Valid-Until']
-        except KeyError:
-            return ''
-    
-    @check_valid_until.setter
-    def check_valid_until(self, data) -> None:
-        try:
-            self.pop('Check-Valid-Until')
-        except KeyError:
-            pass
-
-        if data:
-            self['Check-Valid-Until'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def valid_until_min (self) -> str:
-        """valid_until_min option"""
-        try:
-            return self['Valid-Until-Min']
-        except KeyError:
-            return ''
-    
-    @valid_until_min.setter
-    def valid_until_min(self, data) -> None:
-        try:
-            self.pop('Valid-Until-Min')
-        except KeyError:
-            pass
-
-        if data:
-            self['Valid-Until-Min'] = data
-        self._update_legacy_options()
-
-
-    @property
-    def valid_until_max (self) -> str:
-        """valid_until_max option"""
-        try:
-            return self['Valid-Until-Max']
-        except KeyError:
-            return ''
-    
-    @valid_until_max.setter
-    def valid_until_max(self, data) -> None:
-        try:
-            self.pop('Valid-Until-Max')
-        except KeyError:
-            pass
-
-        if data:
-            self['Valid-Until-Max'] = data
-        self._update_legacy_options()
-    
     @property
     def default_mirror(self) -> str:
         """The default mirror/URI for the source"""
-        try:
-            return self['X-Repolib-Default-Mirror']
-        except KeyError:
-            return ''
+        return self.get('X-Repolib-Default-Mirror', '')
     
     @default_mirror.setter
     def default_mirror(self, mirror) -> None:
-        if mirror:
-            self['X-Repolib-Default-Mirror'] = mirror
-        else:
-            self['X-Repolib-Default-Mirror'] = ''
+        self['X-Repolib-Default-Mirror'] = mirror or ''
 
 
     ## Output Properties
+    def _cached_output(self, kind:str, generate, volatile:bool = False) -> str:
+        """Get an output representation of this source, generating it if needed
+
+        Generated output is reused until a field of the source is changed, or
+        its comments or twin_source are.
+
+        Arguments:
+            kind(str): The name of the representation
+            generate(callable): Generates the representation
+            volatile(bool): Don't cache output if generating it changed fields
+        """
+        cached = self._output_cache.get(kind)
+        state = (self._generation, tuple(self.comments), self.twin_source)
+        if cached and cached[0] == state:
+            return cached[1]
+
+        generation = self._generation
+        output = generate()
+        if not volatile or generation == self._generation:
+            state = (self._generation, tuple(self.comments), self.twin_source)
+            self._output_cache[kind] = (state, output)
+        return output
+
     @property
     def deb822(self) -> str:
         """The DEB822 representation of this source"""
+        return self._cached_output('deb822', self._generate_deb822_output)
+
+    def _generate_deb822_output(self) -> str:
+        """Generate a string of the current source in DEB822 format"""
         self._update_legacy_options()
         # comments get handled separately because they're a list, and list
         # properties don't support .append()
-        if self.comments:
-            self['X-Repolib-Comments'] = '# '
-            self['X-Repolib-Comments'] += ' # '.join(self.comments)
+        if not self.comments:
+            return self.dump() or ''
+
+        comments:str = '# ' + ' # '.join(self.comments)
+        if 'X-Repolib-Comments' not in self and '\n' not in comments:
+            # Append the field to the output, rather than adding it to the
+            # source just to dump it and remove it again
+            return (self.dump() or '') + f'X-Repolib-Comments: {comments}\n'
+
+        self['X-Repolib-Comments'] = comments
         _deb822 = self.dump()
-        if self.comments:
-            self.pop('X-Repolib-Comments')
-        if _deb822:
-            return _deb822
-        return ''
+        self.pop('X-Repolib-Comments')
+        return _deb822 or ''
     
     @property
     def ui(self) -> str:
         """The UI-friendly representation of this source"""
+        return self._cached_output('ui', self._generate_ui_output)
+
+    def _generate_ui_output(self) -> str:
+        """Generate a UI-friendly string of the current source"""
         self._update_legacy_options()
         _ui_list:list = self.deb822.split('\n')
         ui_output: str = f'{self.ident}:\n'
@@ -839,13 +657,21 @@ class Source(deb822.Deb822):
             if key not in util.output_skip_keys:
                 if line:
                     ui_output += f'{line}\n'
-        for key in util.keys_map:
-            ui_output = ui_output.replace(key, util.keys_map[key])
-        return ui_output
+        return util.keys_map_re.sub(
+            lambda match: util.keys_map[match.group(0)], ui_output
+        )
     
     @property
     def legacy(self) -> str:
         """The legacy/one-line format representation of this source"""
+        # Generating this can split a multi-type source, which changes the
+        # output of the next call, so don't cache it in that case
+        return self._cached_output(
+            'legacy', self._generate_legacy_lines, volatile=True
+        )
+
+    def _generate_legacy_lines(self) -> str:
+        """Generate the legacy line(s), including any twin deb-src line"""
         self._update_legacy_options()
 
         if str(self.prefs) != '.':
@@ -870,7 +696,7 @@ class Source(deb822.Deb822):
 
     def _generate_legacy_output(self, sourcecode=False, enabled=True) -> str:
         """Generate a string of the current source in legacy format"""
-        legacy = ''
+        parts:list = []
 
         if len(self.types) > 1:
             self.twin_source = True
@@ -881,38 +707,31 @@ class Source(deb822.Deb822):
                 msg += f'Legacy-format sources support one {attr[:-1]} only.'
                 raise SourceError(msg)
         
-        if not self.enabled.get_bool() and not sourcecode:
-            legacy += '# '
+        if not self._enabled_bool and not sourcecode:
+            parts.append('# ')
         
         if sourcecode and not enabled:
-            legacy += '# '
+            parts.append('# ')
         
         if sourcecode:
-            legacy += 'deb-src '
+            parts.append('deb-src ')
         else:
-            legacy += self.types[0].value
-            legacy += ' '
+            parts.append(f'{self.types[0].value} ')
         
         options_string = self._legacy_options()
         if options_string:
-            legacy += '['
-            legacy += options_string
-            legacy = legacy.strip()
-            legacy += '] '
+            parts.append(f'[{options_string.strip()}] ')
         
-        legacy += f'{self.uris[0]} '
-        legacy += f'{self.suites[0]} '
-
-        for component in self.components:
-            legacy += f'{component} '
+        parts.append(f'{self.uris[0]} ')
+        parts.append(f'{self.suites[0]} ')
+        parts.extend(f'{component} ' for component in self.components)
         
-        legacy += f' ## X-Repolib-Name: {self.name}'
-        legacy += f' # X-Repolib-ID: {self.ident}'
+        parts.append(f' ## X-Repolib-Name: {self.name}')
+        parts.append(f' # X-Repolib-ID: {self.ident}')
         if self.comments:
-            for comment in self.comments:
-                legacy += f' # {comment}'
+            parts.extend(f' # {comment}' for comment in self.comments)
 
-        return legacy
+        return ''.join(parts)
 
     def _legacy_options(self) -> str:
         """Turn the current options into a oneline-style string
@@ -920,26 +739,21 @@ class Source(deb822.Deb822):
         Returns: str
             The one-line-format options string
         """
-        options_str = ''
-        for key in self.options:
-            if self.options[key] != '':
-                options_str += f'{key}={self.options[key].replace(" ", ",")} '
-        return options_str
+        return ''.join(
+            f'{key}={value.replace(" ", ",")} '
+            for key, value in self.options.items() if value != ''
+        )
 
     def _update_legacy_options(self) -> None:
-        """Updates the current set of legacy options"""
-        self.options = {
-            'arch': self.architectures,
-            'lang': self.languages,
-            'target': self.targets,
-            'pdiffs': self.pdiffs,
-            'by-hash': self.by_hash,
-            'allow-insecure': self.allow_insecure,
-            'allow-weak': self.allow_weak,
-            'allow-downgrade-to-insecure': self.allow_downgrade_to_insecure,
-            'trusted': self.trusted,
-            'signed-by': self.signed_by,
-            'check-valid-until': self.check_valid_until,
-            'valid-until-min': self.valid_until_min,
-            'valid-until-max': self.valid_until_max,
-        }
\ No newline at end of file
+        """Updates the current set of legacy options
+
+        The options are only rebuilt if a field has changed since the last
+        update.
+        """
+        if self._options_generation == self._generation:
+            return
+        self._options = {
+            option: self[key] if key in self else ''
+            for key, option in util.options_outmap.items()
+        }
+        self._options_generation = self._generation
\ No newline at end of file
@@ -50,19 +50,23 @@ def load_all_sources() -> None:
             log.info("Ignoring directory '%s'", file)
             continue
         try:
-            sourcefile = SourceFile(name=file.stem)
             log.debug('Loading %s', file)
-            sourcefile.load()
+            # SourceFile loads an existing file itself, so don't parse it twice
+            sourcefile = SourceFile(name=file.stem)
             if file.name not in util.files:
                 util.files[file.name] = sourcefile
 
         except Exception as err:
             util.errors[file.name] = err
     
-    for f in util.files:
-        file = util.files[f]
+    renamed_files:dict = {}
+    for file in util.files.values():
         for source in file.sources:
             if source.ident in util.sources:
                 source.ident = f'{file.name}-{source.ident}'
-                source.file.save()
+                renamed_files[source.file] = None
             util.sources[source.ident] = source
+
+    # Write each file with renamed sources once, rather than once per source
+    for file in renamed_files:
+        file.save()
@@ -20,8 +20,12 @@ You should have received a copy of the GNU Lesser General Public License
 along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
 import unittest
+from unittest import mock
+from urllib import error
 
+from .. import key
 from ..key import SourceKey
 from .. import util, system
 from .. import set_testing
@@ -140,3 +144,114 @@ class KeyTestCase(unittest.TestCase):
         key_load.delete_key()
 
         self.assertFalse(key_load.path.exists())
+
+
+class KeyCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        # Put back the directories in use before this test switched to
+        # fresh testing ones, so later tests don't depend on the order
+        patcher = mock.patch.multiple(
+            util,
+            KEYS_DIR=util.KEYS_DIR,
+            SOURCES_DIR=util.SOURCES_DIR,
+            CACHE_DIR=util.CACHE_DIR,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        set_testing()
+        self.key_data = KEY_DATA
+        self.fingerprint = '63C46DF0140D738961429F4E204DD8AEC33A7AFF'
+        self.etag = '"popdev-key"'
+        self.modified = 'Thu, 22 Jun 2017 17:16:35 GMT'
+
+    def cache_paths(self, fingerprint):
+        cache_path = util.CACHE_DIR / 'keys' / f'{fingerprint}.asc'
+        etag_path = cache_path.with_suffix('.asc.etag')
+        for path in (cache_path, etag_path):
+            path.unlink(missing_ok=True)
+        return cache_path, etag_path
+
+    def response(self, data, etag=None, modified=None):
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.read.return_value = data.encode()
+        response.headers = {'ETag': etag, 'Last-Modified': modified}
+        return response
+
+    def not_modified(self):
+        return error.HTTPError(
+            key.SKS_KEYSERVER, 304, 'Not Modified', {}, None
+        )
+
+    def test_fetch_caches_key(self):
+        cache_path, etag_path = self.cache_paths(self.fingerprint)
+        with mock.patch.object(key.request, 'urlopen') as urlopen:
+            urlopen.return_value = self.response(
+                self.key_data, etag=self.etag, modified=self.modified
+            )
+            data = key.fetch_key_data(self.fingerprint)
+
+        req = urlopen.call_args[0][0]
+        self.assertIsNone(req.get_header('If-none-match'))
+        self.assertEqual(data, self.key_data)
+        self.assertEqual(cache_path.read_text(), self.key_data)
+        self.assertEqual(etag_path.read_text(), self.etag)
+        self.assertEqual(cache_path.stat().st_mtime, 1498151795)
+
+    def test_fetch_revalidates_cached_key(self):
+        cache_path, etag_path = self.cache_paths(self.fingerprint)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(self.key_data)
+        etag_path.write_text(self.etag)
+        os.utime(cache_path, (1498151795, 1498151795))
+
+        with mock.patch.object(key.request, 'urlopen') as urlopen:
+            urlopen.side_effect = [self.not_modified()]
+            data = key.fetch_key_data(self.fingerprint)
+
+        req = urlopen.call_args[0][0]
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertEqual(req.get_header('If-none-match'), self.etag)
+        self.assertEqual(req.get_header('If-modified-since'), self.modified)
+        self.assertEqual(data, self.key_data)
+
+    def test_fetch_rejects_swapped_cached_key(self):
+        # A cached file holding some other key must not be trusted, even if
+        # the keyserver says the requested key is unchanged
+        fingerprint = '0123456789ABCDEF0123456789ABCDEF01234567'
+        cache_path, etag_path = self.cache_paths(fingerprint)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(self.key_data)
+        etag_path.write_text(self.etag)
+
+        with mock.patch.object(key.request, 'urlopen') as urlopen:
+            urlopen.side_effect = [
+                self.not_modified(),
+                self.response('fresh key data'),
+            ]
+            data = key.fetch_key_data(fingerprint)
+
+        req = urlopen.call_args[0][0]
+        self.assertEqual(urlopen.call_count, 2)
+        self.assertIsNone(req.get_header('If-none-match'))
+        self.assertIsNone(req.get_header('If-modified-since'))
+        self.assertEqual(data, 'fresh key data')
+        self.assertEqual(cache_path.read_text(), 'fresh key data')
+        self.assertFalse(etag_path.exists())
+
+    def test_import_skips_unchanged_data(self):
+        key_import = SourceKey(name='popdev-import')
+        key_import.tmp_path.unlink(missing_ok=True)
+        key_import.digest_path.unlink(missing_ok=True)
+
+        with mock.patch.object(
+            key_import.gpg, 'import_keys', wraps=key_import.gpg.import_keys
+        ) as import_keys:
+            key_import.import_key_data(self.key_data)
+            key_import.import_key_data(self.key_data)
+            self.assertEqual(import_keys.call_count, 1)
+
+            key_import.import_key_data(self.key_data + '\n')
+            self.assertEqual(import_keys.call_count, 2)
+
+        self.assertEqual(len(key_import.gpg.list_keys()), 1)
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+
+"""
+Copyright (c) 2022, Ian Santopietro
+All rights reserved.
+
+This file is part of RepoLib.
+
+RepoLib is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RepoLib is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import os
+import unittest
+from unittest import mock
+
+from ..command import Modify, parser
+from .. import util
+
+SOURCE_DATA = (
+    'X-Repolib-Name: Modify Test\n'
+    'X-Repolib-ID: modify-test\n'
+    'Enabled: yes\n'
+    'Types: deb\n'
+    'URIs: http://example.com/ubuntu\n'
+    'Suites: suite\n'
+    'Components: main\n'
+)
+
+class ModifyTestCase(unittest.TestCase):
+    def setUp(self):
+        # Put back the directories in use before this test switched to
+        # fresh testing ones, so later tests don't depend on the order
+        patcher = mock.patch.multiple(
+            util,
+            KEYS_DIR=util.KEYS_DIR,
+            SOURCES_DIR=util.SOURCES_DIR,
+            CACHE_DIR=util.CACHE_DIR,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        util.set_testing()
+        self.log = logging.getLogger(__name__)
+        util.SOURCES_DIR.mkdir(parents=True, exist_ok=True)
+        self.path = util.SOURCES_DIR / 'modify-test.sources'
+        self.path.write_text(SOURCE_DATA)
+        self.addCleanup(self.path.unlink, missing_ok=True)
+
+    def modify(self, *options) -> bool:
+        args = parser.parse_args(['modify', 'modify-test', *options])
+        return Modify(self.log, args, parser).run()
+
+    def assertNotRewritten(self, *options):
+        # Requesting the current state succeeds, without writing the file
+        os.utime(self.path, ns=(0, 0))
+        contents = self.path.read_text()
+        self.assertTrue(self.modify(*options))
+        self.assertEqual(self.path.read_text(), contents)
+        self.assertEqual(self.path.stat().st_mtime_ns, 0)
+
+    def test_enable_disable(self):
+        self.assertNotRewritten('--enable')
+
+        self.assertTrue(self.modify('--disable'))
+        self.assertIn('Enabled: no\n', self.path.read_text())
+        self.assertNotRewritten('--disable')
+
+        self.assertTrue(self.modify('--enable'))
+        self.assertIn('Enabled: yes\n', self.path.read_text())
+
+    def test_source_enable_disable(self):
+        self.assertNotRewritten('--source-disable')
+
+        self.assertTrue(self.modify('--source-enable'))
+        self.assertIn('Types: deb deb-src\n', self.path.read_text())
+        self.assertNotRewritten('--source-enable')
+
+        self.assertTrue(self.modify('--source-disable'))
+        self.assertIn('Types: deb\n', self.path.read_text())
+
+    def test_no_changes_requested(self):
+        self.assertFalse(self.modify())
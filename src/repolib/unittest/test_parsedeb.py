@@ -24,6 +24,7 @@ This is a library for parsing deb lines into deb822-format data.
 
 import unittest
 
+from ..parsedeb import ParseDeb, DebParseError, debsplit
 from ..source import Source
 from .. import util
 
@@ -186,3 +187,45 @@ class DebTestCase(unittest.TestCase):
         source.generate_default_ident()
         self.assertEqual(source.suites, ['suite'])
         self.assertEqual(source.components, ['main'])
+
+    def test_strip_hashes(self):
+        self.assertEqual(util.strip_hashes('##  # foo  ##'), 'foo')
+        self.assertEqual(util.strip_hashes('# deb http://example.com/ suite main #'), 'deb http://example.com/ suite main')
+        self.assertEqual(util.strip_hashes('foo'), 'foo')
+        # A trailing hash is only removed when nothing follows it
+        self.assertEqual(util.strip_hashes('# foo # '), 'foo #')
+        self.assertEqual(util.strip_hashes('# key=value#'), 'key=value')
+
+    def test_option_value_with_equals(self):
+        parser = ParseDeb()
+        options = parser.parse_options('[ arch=amd64 valid-until-min=a=b ]')
+        self.assertEqual(options['Architectures'], 'amd64')
+        self.assertEqual(options['Valid-Until-Min'], 'a=b')
+
+    def test_option_without_value(self):
+        parser = ParseDeb()
+        with self.assertRaises(DebParseError):
+            parser.parse_options('[ arch ]')
+
+    def test_split_unterminated_bracket(self):
+        self.assertEqual(
+            debsplit('deb [arch=amd64] http://m x]y [x \t foo'),
+            ['deb', '[arch=amd64]', 'http://m', 'x]y', '[x foo']
+        )
+        self.assertEqual(
+            debsplit('deb [arch=amd64 http://example.com/%5Bfoo%5D  suite '),
+            ['deb', '[arch=amd64 http://example.com/[foo]', 'suite']
+        )
+
+    def test_split_tab_inside_brackets(self):
+        self.assertEqual(
+            debsplit('deb [\tarch=amd64\t\tlang=en ] http://example.com/ suite main'),
+            ['deb', '[ arch=amd64 lang=en ]', 'http://example.com/', 'suite', 'main']
+        )
+        source = Source()
+        source.load_from_data([
+            'deb [ arch=amd64\tlang=en ] http://example.com/ suite main'
+        ])
+        self.assertEqual(source.architectures, 'amd64')
+        self.assertEqual(source.languages, 'en')
+        self.assertEqual(source.components, ['main'])
@@ -21,11 +21,31 @@ along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import unittest
+from unittest import mock
 
 from ..shortcuts import popdev
-from .. import util
+from .. import key, util
+from .test_key import KEY_DATA
 
 class PopdevTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.multiple(
+            util,
+            KEYS_DIR=util.KEYS_DIR,
+            SOURCES_DIR=util.SOURCES_DIR,
+            CACHE_DIR=util.CACHE_DIR,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        util.set_testing()
+
+        # Serve the signing key locally instead of downloading it
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.read.return_value = KEY_DATA.encode()
+        patcher = mock.patch.object(key.request, 'urlopen', return_value=response)
+        self.urlopen = patcher.start()
+        self.addCleanup(patcher.stop)
     
     def test_ppa(self):
         source = popdev.PopdevSource()
@@ -40,4 +60,5 @@ class PopdevTestCase(unittest.TestCase):
         self.assertEqual(source.suites, [util.DISTRO_CODENAME])
         self.assertEqual(source.components, ['main'])
         self.assertEqual(source.types, [util.SourceType.BINARY])
-        self.assertTrue(source.signed_by.endswith(signed_test))
\ No newline at end of file
+        self.assertTrue(source.signed_by.endswith(signed_test))
+        self.urlopen.assert_called_once()
@@ -138,6 +138,55 @@ class SourceTestCase(unittest.TestCase):
         )
         self.assertEqual(self.source_legacy.legacy, source_string)
 
+    def test_output_cache_invalidated(self):
+        deb822 = self.source.deb822
+        ui = self.source.ui
+        self.assertIs(self.source.deb822, deb822)
+
+        self.source.suites = ['other-suite']
+        self.assertIn('Suites: other-suite\n', self.source.deb822)
+        self.assertIn('Suites: other-suite\n', self.source.ui)
+        self.assertNotEqual(self.source.deb822, deb822)
+        self.assertNotEqual(self.source.ui, ui)
+
+        del self.source['Languages']
+        self.assertNotIn('Languages', self.source.deb822)
+        self.assertNotIn('Languages', self.source.ui)
+
+        self.source.comments = ['A comment']
+        self.assertIn('X-Repolib-Comments: # A comment\n', self.source.deb822)
+        self.source.comments.append('Another')
+        self.assertIn(
+            'X-Repolib-Comments: # A comment # Another\n', self.source.deb822
+        )
+        self.source.comments = []
+        self.assertNotIn('X-Repolib-Comments', self.source.deb822)
+
+    def test_output_legacy_not_stale(self):
+        legacy = self.source_legacy.legacy
+        self.assertEqual(self.source_legacy.legacy, legacy)
+
+        self.source_legacy.suites = ['other-suite']
+        self.assertIn(' other-suite main ', self.source_legacy.legacy)
+
+        self.source_legacy.enabled = False
+        self.assertTrue(self.source_legacy.legacy.startswith('# deb '))
+
+        self.source_legacy.enabled = True
+        self.source_legacy.sourcecode_enabled = True
+        legacy_lines = self.source_legacy.legacy.split('\n')
+        self.assertEqual(len(legacy_lines), 2)
+        self.assertTrue(legacy_lines[1].startswith('deb-src '))
+        # Generating the twin lines splits the source's types, so the output is
+        # regenerated rather than reused from the first call
+        self.assertEqual(
+            self.source_legacy.legacy,
+            self.source_legacy._generate_legacy_lines()
+        )
+
+        self.source_legacy.comments = ['A comment']
+        self.assertTrue(self.source_legacy.legacy.endswith(' # A comment'))
+
     def test_enabled(self):
         self.source.enabled = False
         self.assertFalse(self.source.enabled.get_bool())
@@ -146,6 +195,15 @@ class SourceTestCase(unittest.TestCase):
         self.source.sourcecode_enabled = False
         self.assertEqual(self.source.types, [util.SourceType.BINARY])
     
+    def test_add_list_items(self):
+        self.source.add_uri('http://example.com/other')
+        self.source.add_suite('suite-security')
+        self.source_legacy.components = []
+        self.source_legacy.add_component('main')
+        self.assertEqual(self.source.uris[-1], 'http://example.com/other')
+        self.assertEqual(self.source.suites[-1], 'suite-security')
+        self.assertEqual(self.source_legacy.components, ['main'])
+    
     def test_dict_access(self):
         self.assertEqual(self.source['X-Repolib-ID'], 'test')
         self.assertEqual(self.source['X-Repolib-Name'], 'Test Source')
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+
+"""
+Copyright (c) 2022, Ian Santopietro
+All rights reserved.
+
+This file is part of RepoLib.
+
+RepoLib is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+RepoLib is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from unittest import mock
+
+from .. import util
+
+class PrivilegedObjectTestCase(unittest.TestCase):
+    def setUp(self):
+        util._privileged_object = None
+        self.proxies = [mock.Mock(name='proxy1'), mock.Mock(name='proxy2')]
+        patcher = mock.patch.object(util.dbus, 'SystemBus', create=True)
+        self.system_bus = patcher.start()
+        self.system_bus.return_value.get_object.side_effect = self.proxies
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, util, '_privileged_object', None)
+
+    def test_proxy_is_shared(self):
+        self.assertIs(util.get_privileged_object(), self.proxies[0])
+        self.assertIs(util.get_privileged_object(), self.proxies[0])
+        self.assertEqual(self.system_bus.return_value.get_object.call_count, 1)
+
+    def test_stale_proxy_is_replaced(self):
+        stale = util.dbus.exceptions.DBusException('Service has exited')
+        self.proxies[0].delete_source_file.side_effect = stale
+        self.proxies[1].delete_source_file.return_value = 'done'
+
+        ret = util.call_privileged('delete_source_file', 'test.sources')
+
+        self.assertEqual(ret, 'done')
+        self.proxies[1].delete_source_file.assert_called_once_with('test.sources')
+        self.assertIs(util.get_privileged_object(), self.proxies[1])
+
+    def test_retry_only_once(self):
+        stale = util.dbus.exceptions.DBusException('Service not found')
+        for proxy in self.proxies:
+            proxy.delete_source_file.side_effect = stale
+
+        with self.assertRaises(util.dbus.exceptions.DBusException):
+            util.call_privileged('delete_source_file', 'test.sources')
+        self.assertEqual(self.system_bus.return_value.get_object.call_count, 2)
+
+    def test_dbus_quit_clears_proxy(self):
+        util.get_privileged_object()
+        util.dbus_quit()
+
+        self.proxies[0].exit.assert_called_once_with()
+        self.assertIsNone(util._privileged_object)
+        self.assertIs(util.get_privileged_object(), self.proxies[1])
@@ -22,6 +22,7 @@ along with RepoLib.  If not, see <https://www.gnu.org/licenses/>.
 
 import atexit
 import logging
+import os
 import re
 import tempfile
 
@@ -34,6 +35,10 @@ import dbus
 
 SOURCES_DIR = Path('/etc/apt/sources.list.d')
 KEYS_DIR = Path('/etc/apt/keyrings/')
+_USER_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'repolib'
+CACHE_DIR = _USER_CACHE_DIR
 TESTING = False
 KEYSERVER_QUERY_URL = 'http://keyserver.ubuntu.com/pks/lookup?op=get&search=0x'
 
@@ -74,6 +79,9 @@ class SourceType(Enum):
         ident = ident.replace('deb', 'binary')
         return ident
 
+# SourceType members by value, so parsing Types doesn't go through Enum lookup
+_SRC_TYPE_MAP = {sourcetype.value: sourcetype for sourcetype in SourceType}
+
 class AptSourceEnabled(Enum):
     """ Helper Enum to translate between bool data and the Deb822 format. """
     TRUE = 'yes'
@@ -88,7 +96,7 @@ class AptSourceEnabled(Enum):
 
         return False
 
-valid_keys = [
+valid_keys = (
     'X-Repolib-Name:',
     'X-Repolib-ID:',
     'X-Repolib-Default-Mirror:',
@@ -112,12 +120,12 @@ valid_keys = [
     'Check-Valid-Until:',
     'Valid-Until-Min:',
     'Valid-Until-Max:',
-]
+)
 
-output_skip_keys = [
+output_skip_keys = (
     'X-Repolib-Prefs',
     'X-Repolib-ID', 
-]
+)
 
 options_inmap = {
     'arch': 'Architectures',
@@ -151,7 +159,7 @@ options_outmap = {
     'Valid-Until-Max': 'valid-until-max'
 }
 
-true_values = [
+true_values = frozenset((
     True,
     'True',
     'true',
@@ -162,7 +170,7 @@ true_values = [
     'Y',
     AptSourceEnabled.TRUE,
     1
-]
+))
 
 keys_map = {
     'X-Repolib-Name: ': 'Name: ',
@@ -170,15 +178,23 @@ keys_map = {
     'X-Repolib-Comments: ': 'Comments: ',
     'X-Repolib-Default-Mirror: ': 'Default Mirror: ',
 }
+# Matches any keys_map key, so they can all be replaced in a single pass
+keys_map_re = re.compile('|'.join(
+    re.escape(key) for key in sorted(keys_map, key=len, reverse=True)
+))
 
 PRETTY_PRINT = '\n    '
 
 _KEYS_TEMPDIR = tempfile.TemporaryDirectory()
 TEMP_DIR = Path(_KEYS_TEMPDIR.name)
 
-options_re = re.compile(r'[^@.+]\[([^[]+.+)\]\ ')
+options_re = re.compile(r'(?:^|(?<=\s))\[([^\]]+)\]\s')
 uri_re = re.compile(r'\w+:(\/?\/?)[^\s]+')
 
+# Plain http(s)/ftp URIs with a host are always valid, so url_validator() can
+# accept them without a full urlparse(). Anything else falls through.
+_uri_fast_match = re.compile(r'(?:https?|ftp)://\w[^\s\[\]]*', re.ASCII).fullmatch
+
 CLEAN_CHARS = {
     33: None,
     64: 45,
@@ -237,17 +253,20 @@ def set_testing(testing:bool=True) -> None:
     """
     global KEYS_DIR
     global SOURCES_DIR
+    global CACHE_DIR
 
     testing_tempdir = tempfile.TemporaryDirectory()
 
     if not testing:
         KEYS_DIR = '/usr/share/keyrings'
         SOURCES_DIR = '/etc/apt/sources.list.d'
+        CACHE_DIR = _USER_CACHE_DIR
         return
     
     testing_root = Path(testing_tempdir.name)
     KEYS_DIR = testing_root / 'usr' / 'share' / 'keyrings'
     SOURCES_DIR = testing_root / 'etc' / 'apt' / 'sources.list.d'
+    CACHE_DIR = testing_root / 'cache' / 'repolib'
 
 
 def _cleanup_temsps() -> None:
@@ -257,10 +276,43 @@ def _cleanup_temsps() -> None:
 
 atexit.register(_cleanup_temsps)
 
+_privileged_object = None
+
+def get_privileged_object():
+    """Get the proxy object for the privileged repolib DBus service.
+
+    The proxy is created on first use and shared by later calls.
+    """
+    global _privileged_object
+    if _privileged_object is None:
+        bus = dbus.SystemBus()
+        _privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
+    return _privileged_object
+
+def call_privileged(method:str, *args):
+    """Call a method on the privileged repolib DBus service.
+
+    The service is bus-activated, and may have exited or restarted since the
+    shared proxy was created. If the call fails, the proxy is recreated and the
+    call is tried once more.
+
+    Arguments:
+        method(str): The name of the method to call
+        *args: The arguments to pass to the method
+    """
+    global _privileged_object
+    try:
+        return getattr(get_privileged_object(), method)(*args)
+    except dbus.exceptions.DBusException:
+        _privileged_object = None
+        return getattr(get_privileged_object(), method)(*args)
+
 def dbus_quit():
-    bus = dbus.SystemBus()
-    privileged_object = bus.get_object('org.pop_os.repolib', '/Repo')
-    privileged_object.exit()
+    global _privileged_object
+    try:
+        call_privileged('exit')
+    finally:
+        _privileged_object = None
 
 def compare_sources(source1, source2, excl_keys:list) -> bool:
     """Compare two sources based on arbitrary criteria.
@@ -278,22 +330,11 @@ def compare_sources(source1, source2, excl_keys:list) -> bool:
     for key in source1:
         if key in excl_keys:
             continue
-        if key in source2:
-            if source1[key] != source2[key]:
-                return False
-            else:
-                continue
-        else:
+        if key not in source2 or source1[key] != source2[key]:
             return False
+    # Shared keys were compared above, so only look for keys missing in source1
     for key in source2:
-        if key in excl_keys:
-            continue
-        if key in source1:
-            if source1[key] != source2[key]:
-                return False
-            else:
-                continue
-        else:
+        if key not in excl_keys and key not in source1:
             return False
     return True
 
@@ -389,6 +430,11 @@ def url_validator(url):
         # pylint: disable=no-else-return,bare-except
         # A) We want to return false if the URL doesn't contain those parts
         # B) We need this to not throw any exceptions, regardless what they are
+        if ':' not in url:
+            # Can't have a scheme, so skip the comparatively expensive parse
+            return False
+        if url.isascii() and _uri_fast_match(url):
+            return True
         result = urlparse(url)
         if not result.scheme:
             return False
@@ -446,10 +492,7 @@ def strip_hashes(line:str) -> str:
         (str): The input line without any leading/trailing hashes or 
             leading/trailing whitespace.
     """
-    while True:
-        line = line.strip('#')
-        line = line.strip()
-        if not line.startswith('#'):
-            break
-    
+    line = line.strip('#').strip()
+    while line.startswith('#'):
+        line = line.strip('#').strip()
     return line